@@ -8,19 +8,49 @@ Gestures:
 
 Requirements:
     pip install opencv-python mediapipe numpy pywin32
+    Optional: pip install numba (JIT-compiles the per-frame gesture classifier)
+    Download the hand landmarker model next to this script:
+    https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/1/hand_landmarker.task
 """
 
 import cv2
+from dataclasses import dataclass
 import mediapipe as mp
-import math
+from mediapipe.tasks import python as mp_tasks
+from mediapipe.tasks.python import vision
+import numpy as np
+import os
+import queue
+import threading
 import time
 
 # --- Configuration ---
 ZOOM_SENSITIVITY = 0.05    # Sensitivity for depth zoom
 SWIPE_THRESHOLD = 60       # Pixels finger must move to trigger slide
+PINCH_THRESHOLD = 40       # Pixels between thumb and index tips to count as a pinch
 SWIPE_COOLDOWN = 1.5       # Seconds to wait between slides
+VIEW_REFRESH_INTERVAL = 2.0 # Seconds before the cached PPT view is looked up again
+ZOOM_STEP = 5              # Zoom percent per detected zoom gesture frame
+ZOOM_FLUSH_INTERVAL = 0.05 # Seconds between batched zoom writes (<= 20 Hz)
+FRAME_WIDTH = 640          # Requested camera resolution
+FRAME_HEIGHT = 480
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__)) # Models live next to this script
+MODEL_PATH = os.path.join(SCRIPT_DIR, 'hand_landmarker.task')
+INT8_MODEL_PATH = os.path.join(SCRIPT_DIR, 'hand_landmarker_int8.task') # Used on the CPU delegate if present
+INFERENCE_SCALE = 0.5      # Frame scale fed to MediaPipe (landmarks are normalized)
+MOTION_THRESHOLD = 2.0     # Mean grey-level change below which inference is skipped
+DEBUG_OVERLAY = True       # Draw the hand skeleton on the preview
+USE_OPENCL = True          # Run flip/resize/colour conversion through OpenCV's OpenCL T-API
+UI_INTERVAL = 1 / 30       # Seconds between preview refreshes (camera is ~30 FPS)
+CV_THREADS = max(1, (os.cpu_count() or 2) // 2) # ~physical cores for OpenCV's own pool
+
+# Distances are compared squared (no sqrt), so square the thresholds once
+PINCH_T2 = PINCH_THRESHOLD ** 2
+ZOOM_IN_T = (1 + ZOOM_SENSITIVITY) ** 2
+ZOOM_OUT_T = (1 - ZOOM_SENSITIVITY) ** 2
 
 try:
+    import pythoncom
     import win32com.client
     HAS_WIN32 = True
 except ImportError:
@@ -30,17 +60,103 @@ try:
     HAS_PYAUTOGUI = True
 except ImportError:
     HAS_PYAUTOGUI = False
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda f: f # Plain Python fallback
 
 # --- PPT Controller ---
 class PPTController:
+    # COM calls run on a worker thread so the capture loop never waits on
+    # PowerPoint. Public methods only enqueue work; _do_* run on the worker.
+    COLLAPSIBLE = ('reset_zoom', 'invalidate_cache')
+
     def __init__(self):
         self.app = None
         self.last_slide_time = 0
+        # Cached to avoid two COM round-trips per swipe (filled lazily)
+        self._slide_count_cache = None
+        self._current_index_cache = None
+        # Slideshow or Normal view, looked up once instead of on every call
+        self._active_view = None
+        self._in_slideshow = False
+        self._view_time = 0
+        # Zoom steps accumulated between flushes to the worker
+        self._last_zoom_time = 0
+        self._zoom_pending = 0
+        self._q = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def _connect(self):
+        # COM objects belong to the thread that created them
         if HAS_WIN32:
+            pythoncom.CoInitialize()
             try:
                 self.app = win32com.client.Dispatch("PowerPoint.Application")
             except:
                 print("Error connecting to PowerPoint.")
+        self._refresh_view()
+
+    def _worker(self):
+        self._connect()
+        while True:
+            name, args = self._q.get()
+            if name is None: break
+            if name in self.COLLAPSIBLE and self._has_later_duplicate(name):
+                continue
+            try:
+                getattr(self, '_do_' + name)(*args)
+            except Exception as e:
+                # Keep the worker alive, otherwise every later action just queues up
+                print(f"PPT action '{name}' failed: {e!r}")
+        if HAS_WIN32:
+            pythoncom.CoUninitialize()
+
+    def _has_later_duplicate(self, name):
+        # True if the same request is still pending ahead of any other kind of
+        # action, so only the latest one of a held fist's R, I, R, I... runs
+        with self._q.mutex:
+            for pending, _ in self._q.queue:
+                if pending == name:
+                    return True
+                if pending not in self.COLLAPSIBLE:
+                    return False
+        return False
+
+    def close(self):
+        self._q.put((None, ()))
+        self._thread.join(timeout=2)
+
+    def _refresh_view(self):
+        self._view_time = time.time()
+        old_view, was_slideshow = self._active_view, self._in_slideshow
+        try:
+            if self.app.SlideShowWindows.Count > 0:
+                self._active_view = self.app.SlideShowWindows(1).View
+                self._in_slideshow = True
+            else:
+                self._active_view = self.app.ActiveWindow.View
+                self._in_slideshow = False
+        except:
+            self._active_view = None
+            self._in_slideshow = False
+        # Switching view (e.g. F5 starts the slideshow at slide 1) makes the
+        # cached index/count meaningless
+        try:
+            view_changed = self._active_view != old_view
+        except:
+            view_changed = True
+        if view_changed or self._in_slideshow != was_slideshow:
+            self._slide_count_cache = None
+            self._current_index_cache = None
+
+    def _get_view(self):
+        # Re-check now and then so starting the slideshow (F5) is picked up
+        if self._active_view is None or time.time() - self._view_time > VIEW_REFRESH_INTERVAL:
+            self._refresh_view()
+        return self._active_view
 
     def _can_trigger(self):
         # Prevents double-firing (cooldown)
@@ -59,199 +175,488 @@ class PPTController:
 
     def get_current_slide_index(self):
         try:
-            # Try Slideshow view first
-            if self.app.SlideShowWindows.Count > 0:
-                return self.app.SlideShowWindows(1).View.Slide.SlideIndex
-            # Try Normal view
-            return self.app.ActiveWindow.View.Slide.SlideIndex
+            return self._get_view().Slide.SlideIndex
         except:
+            self._active_view = None
             return 1
 
+    def _fill_cache(self):
+        if self._slide_count_cache is None:
+            total = self.get_slide_count()
+            self._slide_count_cache = total if total > 0 else None # 0 means unknown
+        if self._current_index_cache is None:
+            self._current_index_cache = self.get_current_slide_index()
+
+    def invalidate_cache(self):
+        # Current slide may have been changed by hand; re-read it on the next swipe
+        self._q.put(('invalidate_cache', ()))
+
+    def _do_invalidate_cache(self):
+        self._current_index_cache = None
+
     def next_slide(self):
         if not self._can_trigger(): return "Cooldown"
+
+        # The worker does the end-of-slides check against fresh COM values
+        self._q.put(('next_slide', ()))
+        return "Next Slide >" # Optimistic, the COM call happens on the worker
+
+    def _do_next_slide(self):
+        # Refreshing the view can drop the caches, so do it before filling them
+        view = self._get_view()
+        self._fill_cache()
+        current = self._current_index_cache
         
-        total = self.get_slide_count()
-        current = self.get_current_slide_index()
-        
-        if current >= total and total > 0:
-            return "End of Slides" # Don't go past end
+        if self._slide_count_cache is not None and current >= self._slide_count_cache:
+            # Re-check once at the boundary: slides may have been added, or the
+            # slide changed by clicker/keyboard since the index was cached
+            self._slide_count_cache = None
+            self._current_index_cache = None
+            self._fill_cache()
+            current = self._current_index_cache
+            total = self._slide_count_cache
+            if total is not None and current >= total:
+                return # Don't go past end
 
         try:
-            if self.app.SlideShowWindows.Count > 0:
-                self.app.SlideShowWindows(1).View.Next()
-            else:
-                self.app.ActiveWindow.View.Next()
-            return "Next Slide >"
+            view.Next()
         except:
+            self._active_view = None
+            self._slide_count_cache = None
+            self._current_index_cache = None
             if HAS_PYAUTOGUI: pyautogui.press('right')
-            return "Key: Right"
+            return
+        if self._current_index_cache is not None:
+            self._current_index_cache += 1
 
     def prev_slide(self):
         if not self._can_trigger(): return "Cooldown"
 
-        current = self.get_current_slide_index()
-        if current <= 1:
-            return "Start of Slides" # Don't go before start
+        # The worker does the start-of-slides check against fresh COM values
+        self._q.put(('prev_slide', ()))
+        return "< Prev Slide"
+
+    def _do_prev_slide(self):
+        # Refreshing the view can drop the caches, so do it before filling them
+        view = self._get_view()
+        self._fill_cache()
+        if self._current_index_cache <= 1:
+            # Re-read at the boundary in case the slide was changed by hand
+            self._current_index_cache = None
+            self._fill_cache()
+            if self._current_index_cache <= 1:
+                return # Don't go before start
 
         try:
-            if self.app.SlideShowWindows.Count > 0:
-                self.app.SlideShowWindows(1).View.Previous()
-            else:
-                self.app.ActiveWindow.View.Previous()
-            return "< Prev Slide"
+            view.Previous()
         except:
+            self._active_view = None
+            self._slide_count_cache = None
+            self._current_index_cache = None
             if HAS_PYAUTOGUI: pyautogui.press('left')
-            return "Key: Left"
+            return
+        if self._current_index_cache is not None:
+            self._current_index_cache -= 1
 
     def zoom(self, direction):
+        self._zoom_pending += ZOOM_STEP if direction == 'in' else -ZOOM_STEP
+        if time.monotonic() - self._last_zoom_time > ZOOM_FLUSH_INTERVAL:
+            self.flush_zoom()
+
+    def flush_zoom(self):
+        # Send any accumulated steps; also called when the pinch ends so a
+        # leftover delta doesn't leak into the next zoom gesture
+        if self._zoom_pending:
+            self._last_zoom_time = time.monotonic()
+            self._q.put(('zoom', (self._zoom_pending,)))
+            self._zoom_pending = 0
+
+    def _do_zoom(self, delta):
         # Zoom usually only works in Edit mode, not Slideshow
         try:
-            if self.app.SlideShowWindows.Count == 0:
-                view = self.app.ActiveWindow.View
-                current = view.Zoom
-                if direction == 'in':
-                    view.Zoom = min(400, current + 5)
-                else:
-                    view.Zoom = max(10, current - 5)
+            view = self._get_view()
+            if not self._in_slideshow:
+                view.Zoom = max(10, min(400, view.Zoom + delta))
         except:
-            pass
+            self._active_view = None
 
     def reset_zoom(self):
+        self._zoom_pending = 0
+        self._q.put(('reset_zoom', ()))
+
+    def _do_reset_zoom(self):
         try:
-            if self.app.SlideShowWindows.Count == 0:
-                self.app.ActiveWindow.View.ZoomToFit = True
+            view = self._get_view()
+            if not self._in_slideshow:
+                view.ZoomToFit = True
         except:
-            pass
+            self._active_view = None
+
+# --- Gesture Classifier ---
+GESTURE_NONE, GESTURE_FIST, GESTURE_PINCH, GESTURE_POINTER = 0, 1, 2, 3
+# Index/Middle/Ring/Pinky tips and their pip joints, for the finger-up mask
+FINGER_TIP_IDS = np.array([8, 12, 16, 20])
+FINGER_PIP_IDS = np.array([6, 10, 14, 18])
+
+# fastmath without 'nnan': NaN marks an unset anchor/base and must survive
+@njit(cache=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+def classify(pts, swipe_anchor, zoom_base):
+    # pts: (21, 2) pixel-space landmarks. swipe_anchor / zoom_base are NaN when unset.
+    # Returns (gesture_id, hand_size2, current_x, diff) where diff is the
+    # x-move from swipe_anchor (POINTER) or the squared size ratio to zoom_base (PINCH).
+    # Squared pinch distance (Thumb tip 4 to Index tip 8)
+    dx = pts[4, 0] - pts[8, 0]
+    dy = pts[4, 1] - pts[8, 1]
+    pinch_d2 = float(dx * dx + dy * dy)
+    # Squared Hand Size (Wrist 0 to Middle Finger Knuckle 9) - for Depth Zoom
+    dx = pts[0, 0] - pts[9, 0]
+    dy = pts[0, 1] - pts[9, 1]
+    hand_size2 = float(dx * dx + dy * dy)
+
+    # Finger States (Check if tips are above pip joints)
+    # Note: Y decreases upwards
+    # One vectorized compare, fast both as plain NumPy and under numba
+    ups = pts[FINGER_TIP_IDS, 1] < pts[FINGER_PIP_IDS, 1]
+    fingers_count = ups.sum()
+    index_up = ups[0]
+
+    current_x = float(pts[8, 0]) # Track Index Tip
+    diff = np.nan
+    if fingers_count == 0: # Strict check: 0 fingers up
+        gesture_id = GESTURE_FIST
+    elif pinch_d2 < PINCH_T2: # Priority over pointer if thumb and index are touching
+        gesture_id = GESTURE_PINCH
+        diff = hand_size2 / zoom_base
+    elif fingers_count <= 2 and index_up: # Index is UP, others are (mostly) DOWN
+        gesture_id = GESTURE_POINTER
+        diff = current_x - swipe_anchor
+    else:
+        gesture_id = GESTURE_NONE
+    return gesture_id, hand_size2, current_x, diff
+
+# Compile (or load from the numba cache) now rather than on the first hand
+classify(np.zeros((21, 2), dtype=np.float32), np.nan, np.nan)
 
 # --- Main Script ---
 ppt = PPTController()
-mp_hands = mp.solutions.hands
-hands = mp_hands.Hands(model_complexity=0, max_num_hands=1, min_detection_confidence=0.7, min_tracking_confidence=0.7)
-mp_drawing = mp.solutions.drawing_utils
+# Skeleton edges as (start, end) landmark index pairs for one cv2.polylines call
+CONNECTIONS_NP = np.array([(c.start, c.end) for c in vision.HandLandmarksConnections.HAND_CONNECTIONS],
+                          dtype=np.int32)
+FINGERTIPS = [4, 8, 12, 16, 20]
+
+class ResultSlot:
+    # Latest HandLandmarker result, written by the MediaPipe callback thread
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._result = None
+        self._timestamp_ms = -1 # Newest timestamp delivered by the callback
+
+    def set(self, result, timestamp_ms=None):
+        with self._cond:
+            self._result = result
+            if timestamp_ms is not None:
+                self._timestamp_ms = timestamp_ms
+            self._cond.notify_all()
+
+    def wait_for_timestamp(self, timestamp_ms, timeout):
+        with self._cond:
+            return self._cond.wait_for(lambda: self._timestamp_ms >= timestamp_ms, timeout)
+
+    def get(self):
+        with self._cond:
+            return self._result
+
+latest_result = ResultSlot()
+
+def on_result(result, output_image, timestamp_ms):
+    latest_result.set(result, timestamp_ms)
+
+def create_landmarker(delegate, model_path=MODEL_PATH):
+    options = vision.HandLandmarkerOptions(
+        base_options=mp_tasks.BaseOptions(model_asset_path=model_path, delegate=delegate),
+        running_mode=vision.RunningMode.LIVE_STREAM,
+        num_hands=1,
+        # Low detection / high tracking: the cheap landmark model carries stable
+        # frames and the palm detector only re-fires when tracking is lost
+        min_hand_detection_confidence=0.5,
+        min_hand_presence_confidence=0.5,
+        min_tracking_confidence=0.85,
+        result_callback=on_result)
+    return vision.HandLandmarker.create_from_options(options)
+
+def create_cpu_landmarker():
+    # A full-integer quantized model runs faster through XNNPACK on CPU
+    cpu_model = INT8_MODEL_PATH if os.path.exists(INT8_MODEL_PATH) else MODEL_PATH
+    if not os.path.exists(cpu_model):
+        raise SystemExit(f"Model file '{MODEL_PATH}' not found. "
+                         "Download hand_landmarker.task next to this script (see README, Installation step 3).")
+    return create_landmarker(mp_tasks.BaseOptions.Delegate.CPU, cpu_model)
+
+# GPU delegate is only available on Linux/macOS wheels and uses the float model;
+# fall back to CPU elsewhere (or when only the INT8 bundle is present)
+if os.path.exists(MODEL_PATH):
+    try:
+        landmarker = create_landmarker(mp_tasks.BaseOptions.Delegate.GPU)
+    except Exception:
+        print("GPU delegate unavailable, using CPU.")
+        landmarker = create_cpu_landmarker()
+else:
+    landmarker = create_cpu_landmarker()
 
 cap = cv2.VideoCapture(0)
+# Keep only the freshest frame and ask for MJPG to cut USB bandwidth / decode cost
+cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+cap.set(cv2.CAP_PROP_FRAME_WIDTH, FRAME_WIDTH)
+cap.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_HEIGHT)
 
 # State Variables
-state = {
-    'zoom_base': None,      # Hand size when pinch started
-    'swipe_anchor': None,   # X position when pointer started
-    'status_text': "Ready"
-}
+@dataclass(slots=True)
+class GestureState:
+    zoom_base: float | None = None      # Squared hand size when pinch started
+    swipe_anchor: float | None = None   # X position when pointer started
+    status_text: str = "Ready"
+
+state = GestureState()
+
+# OpenCL T-API: cv2.UMat inputs dispatch to the GPU when a device is available
+cv2.ocl.setUseOpenCL(USE_OPENCL)
+USE_UMAT = USE_OPENCL and cv2.ocl.haveOpenCL()
+cv2.setNumThreads(CV_THREADS)
+
+# Warm-up: the first detections allocate the interpreter and initialise the
+# delegate (palm detector and landmark model on separate frames), so pay
+# that cost here instead of on the user's first gesture
+warm = np.zeros((int(FRAME_HEIGHT * INFERENCE_SCALE), int(FRAME_WIDTH * INFERENCE_SCALE), 3),
+                dtype=np.uint8)
+# One frame at a time: LIVE_STREAM drops frames sent while one is in flight
+for ts in (1, 2):
+    landmarker.detect_async(mp.Image(image_format=mp.ImageFormat.SRGB, data=warm), ts)
+    latest_result.wait_for_timestamp(ts, timeout=5)
+# Every warm-up callback has landed, so clearing now sticks: the motion gate
+# must not reuse the empty warm-up result
+latest_result.set(None)
+
+# --- Pipeline (capture -> inference -> main/UI+PPT) ---
+# Size-1 queues: producers drop the stale item so consumers always get the newest one
+capture_q = queue.Queue(maxsize=1)
+result_q = queue.Queue(maxsize=1)
+stop_event = threading.Event()
+
+def put_latest(q, item):
+    try:
+        q.get_nowait() # Drop the stale item
+    except queue.Empty:
+        pass
+    try:
+        q.put(item, block=False)
+    except queue.Full:
+        pass
+
+def capture_loop():
+    while not stop_event.is_set() and cap.isOpened():
+        success, frame = cap.read()
+        if not success: continue
+
+        # Flip for mirror effect
+        frame = cv2.flip(cv2.UMat(frame) if USE_UMAT else frame, 1)
+        put_latest(capture_q, frame)
+    stop_event.set()
 
-def get_dist(p1, p2, w, h):
-    return math.hypot((p1.x - p2.x) * w, (p1.y - p2.y) * h)
+def inference_loop():
+    last_ts = 0
+    prev_gray = None
+    # Scratch buffers owned by this thread, reused every frame (dst=) instead of
+    # allocating fresh arrays. Two grey buffers so prev_gray is never overwritten.
+    small_buf = rgb_buf = None
+    thumb_buf = np.empty((120, 160, 3), dtype=np.uint8)
+    gray_bufs = [np.empty((120, 160), dtype=np.uint8) for _ in range(2)]
+    gray_idx = 0
+    while not stop_event.is_set():
+        try:
+            frame = capture_q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+
+        if USE_UMAT:
+            uframe = frame
+            frame = uframe.get() # Host copy for the UI thread
+
+        # Work on a downscaled copy; the displayed frame stays full size
+        h, w, _ = frame.shape
+        small_size = (int(w * INFERENCE_SCALE), int(h * INFERENCE_SCALE))
+        if USE_UMAT:
+            usmall = cv2.resize(uframe, small_size, interpolation=cv2.INTER_LINEAR)
+            small_buf = usmall.get()
+        else:
+            if small_buf is None or small_buf.shape[1::-1] != small_size:
+                small_buf = np.empty((small_size[1], small_size[0], 3), dtype=np.uint8)
+                rgb_buf = np.empty_like(small_buf)
+            cv2.resize(frame, small_size, dst=small_buf, interpolation=cv2.INTER_LINEAR)
+
+        # Motion gate: a still scene keeps the previous landmarks valid
+        cv2.resize(small_buf, (160, 120), dst=thumb_buf, interpolation=cv2.INTER_AREA)
+        gray = gray_bufs[gray_idx]
+        cv2.cvtColor(thumb_buf, cv2.COLOR_BGR2GRAY, dst=gray)
+        if prev_gray is not None and latest_result.get() is not None:
+            if np.mean(cv2.absdiff(prev_gray, gray)) < MOTION_THRESHOLD:
+                put_latest(result_q, frame)
+                continue
+        prev_gray = gray # Only advance on inferred frames so slow drift still adds up
+        gray_idx ^= 1
+
+        if USE_UMAT:
+            rgb_buf = cv2.cvtColor(usmall, cv2.COLOR_BGR2RGB).get()
+        else:
+            cv2.cvtColor(small_buf, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+        # LIVE_STREAM needs strictly increasing timestamps (mp.Image copies rgb_buf)
+        ts = max(int(time.monotonic() * 1000), last_ts + 1)
+        landmarker.detect_async(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_buf), ts)
+        last_ts = ts
+        put_latest(result_q, frame)
 
-while cap.isOpened():
-    success, frame = cap.read()
-    if not success: continue
+# --- UI Overlay Template ---
+# Info bar and static labels are rendered once; per frame only the values are drawn
+OVERLAY_HEIGHT = 60
+CMD_LABEL, MODE_LABEL = "CMD: ", "Mode: "
+CMD_X = 20 + cv2.getTextSize(CMD_LABEL, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)[0][0]
+MODE_X_OFFSET = cv2.getTextSize(MODE_LABEL, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 1)[0][0]
 
-    # Flip for mirror effect
-    frame = cv2.flip(frame, 1)
+def build_overlay(w):
+    overlay = np.empty((OVERLAY_HEIGHT, w, 3), dtype=np.uint8)
+    overlay[:] = (50, 50, 50) # Info bar background
+    cv2.putText(overlay, CMD_LABEL, (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+    cv2.putText(overlay, MODE_LABEL, (w - 250, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 1)
+    return overlay
+
+overlay_template = None
+next_show = 0 # Deadline for the next preview refresh
+
+capture_thread = threading.Thread(target=capture_loop, daemon=True)
+inference_thread = threading.Thread(target=inference_loop, daemon=True)
+capture_thread.start()
+inference_thread.start()
+
+while not stop_event.is_set():
+    try:
+        frame = result_q.get(timeout=0.1)
+    except queue.Empty:
+        continue
     h, w, _ = frame.shape
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    results = hands.process(rgb)
+    result = latest_result.get()
+    # Gesture logic runs every frame; drawing + imshow only at UI_INTERVAL.
+    # Stamped on frame arrival and scheduled against the previous deadline, so a
+    # 30 FPS camera isn't halved by processing time
+    now = time.monotonic()
+    show_ui = now >= next_show
 
     active_gesture = "None"
     
-    if results.multi_hand_landmarks:
-        for hand_lm in results.multi_hand_landmarks:
-            lm = hand_lm.landmark
-            mp_drawing.draw_landmarks(frame, hand_lm, mp_hands.HAND_CONNECTIONS)
-
+    if result is not None and result.hand_landmarks:
+        for lm in result.hand_landmarks:
             # 1. GEOMETRY CHECKS
-            # Pinch distance (Thumb tip 4 to Index tip 8)
-            pinch_dist = get_dist(lm[4], lm[8], w, h)
-            # Hand Size (Wrist 0 to Middle Finger Knuckle 9) - for Depth Zoom
-            hand_size = get_dist(lm[0], lm[9], w, h)
-            
-            # Finger States (Check if tips are above pip joints)
-            # Note: Y decreases upwards
-            index_up = lm[8].y < lm[6].y
-            middle_up = lm[12].y < lm[10].y
-            ring_up = lm[16].y < lm[14].y
-            pinky_up = lm[20].y < lm[18].y
-            
-            fingers_count = sum([index_up, middle_up, ring_up, pinky_up])
+            # All 21 landmarks as one (21, 2) pixel-space array
+            pts = np.fromiter((c for p in lm for c in (p.x, p.y)), dtype=np.float32,
+                              count=42).reshape(21, 2) * np.array([w, h], dtype=np.float32)
+
+            if DEBUG_OVERLAY and show_ui:
+                pts_xy = pts.astype(np.int32)
+                cv2.polylines(frame, pts_xy[CONNECTIONS_NP], False, (0, 255, 0), 1, cv2.LINE_AA)
+                for i in FINGERTIPS:
+                    cv2.circle(frame, (int(pts_xy[i, 0]), int(pts_xy[i, 1])), 4, (0, 0, 255), -1)
+
+            swipe_anchor = state.swipe_anchor
+            zoom_base = state.zoom_base
+            gesture_id, hand_size2, current_x, diff = classify(
+                pts,
+                np.nan if swipe_anchor is None else swipe_anchor,
+                np.nan if zoom_base is None else zoom_base)
             
             # 2. LOGIC TREE
             
             # --- A. FIST (RESET) ---
-            # Strict check: 0 fingers up
-            if fingers_count == 0:
+            if gesture_id == GESTURE_FIST:
                 active_gesture = "FIST (Reset)"
                 ppt.reset_zoom()
-                state['zoom_base'] = None
-                state['swipe_anchor'] = None
+                ppt.invalidate_cache()
+                state.zoom_base = None
+                state.swipe_anchor = None
 
             # --- B. PINCH (ZOOM) ---
-            # Priority over pointer if thumb and index are touching
-            elif pinch_dist < 40: 
+            elif gesture_id == GESTURE_PINCH:
                 active_gesture = "PINCH (Zoom)"
-                state['swipe_anchor'] = None # Cancel swipe
+                state.swipe_anchor = None # Cancel swipe
                 
-                if state['zoom_base'] is None:
-                    state['zoom_base'] = hand_size # Lock initial size
+                if state.zoom_base is None:
+                    state.zoom_base = hand_size2 # Lock initial size
                 else:
-                    # Calculate Ratio
-                    ratio = hand_size / state['zoom_base']
-                    if ratio > (1 + ZOOM_SENSITIVITY):
+                    # diff is the squared size ratio for a pinch
+                    if diff > ZOOM_IN_T:
                         ppt.zoom('in')
-                        state['status_text'] = "Zooming In"
-                        state['zoom_base'] = hand_size * 0.99 # Update ref smoothly
-                    elif ratio < (1 - ZOOM_SENSITIVITY):
+                        state.status_text = "Zooming In"
+                        state.zoom_base = hand_size2 * 0.99 ** 2 # Update ref smoothly
+                    elif diff < ZOOM_OUT_T:
                         ppt.zoom('out')
-                        state['status_text'] = "Zooming Out"
-                        state['zoom_base'] = hand_size * 1.01
+                        state.status_text = "Zooming Out"
+                        state.zoom_base = hand_size2 * 1.01 ** 2
 
             # --- C. POINTER (SWIPE) ---
-            # Check: Index is UP, others are DOWN (or mostly down)
-            elif fingers_count <= 2 and index_up:
+            elif gesture_id == GESTURE_POINTER:
                 active_gesture = "POINTER (Nav)"
-                state['zoom_base'] = None # Cancel zoom
+                state.zoom_base = None # Cancel zoom
                 
-                current_x = lm[8].x * w # Track Index Tip
-                
-                if state['swipe_anchor'] is None:
-                    state['swipe_anchor'] = current_x # Lock starting position
+                if state.swipe_anchor is None:
+                    state.swipe_anchor = current_x # Lock starting position
                 else:
-                    diff = current_x - state['swipe_anchor']
-                    
                     # Draw a visual line to show drag
-                    cv2.line(frame, (int(state['swipe_anchor']), int(lm[8].y*h)), 
-                             (int(current_x), int(lm[8].y*h)), (0, 255, 255), 3)
+                    if show_ui:
+                        cv2.line(frame, (int(state.swipe_anchor), int(pts[8, 1])), 
+                                 (int(current_x), int(pts[8, 1])), (0, 255, 255), 3)
 
                     if diff > SWIPE_THRESHOLD: # Moved Right
                         res = ppt.next_slide()
-                        state['status_text'] = res
-                        state['swipe_anchor'] = None # Reset anchor
+                        state.status_text = res
+                        state.swipe_anchor = None # Reset anchor
                     elif diff < -SWIPE_THRESHOLD: # Moved Left
                         res = ppt.prev_slide()
-                        state['status_text'] = res
-                        state['swipe_anchor'] = None # Reset anchor
+                        state.status_text = res
+                        state.swipe_anchor = None # Reset anchor
 
             else:
                 # Neutral
-                state['zoom_base'] = None
-                state['swipe_anchor'] = None
+                state.zoom_base = None
+                state.swipe_anchor = None
+
+    # Pinch ended (other gesture or hand lost): send what's left of the zoom
+    if active_gesture != "PINCH (Zoom)":
+        ppt.flush_zoom()
 
     # --- UI Overlay ---
-    # Info bar background
-    cv2.rectangle(frame, (0, 0), (w, 60), (50, 50, 50), -1)
-    
-    # Status Text
-    color = (0, 255, 0) if "Cooldown" not in state['status_text'] else (0, 0, 255)
-    cv2.putText(frame, f"CMD: {state['status_text']}", (20, 40), 
-                cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
-    
-    # Gesture Debug
-    cv2.putText(frame, f"Mode: {active_gesture}", (w - 250, 40), 
-                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 1)
+    if show_ui:
+        # Info bar background + labels
+        if overlay_template is None or overlay_template.shape[1] != w:
+            overlay_template = build_overlay(w)
+        frame[:OVERLAY_HEIGHT] = overlay_template
+        
+        # Status Text
+        color = (0, 255, 0) if "Cooldown" not in state.status_text else (0, 0, 255)
+        cv2.putText(frame, state.status_text, (CMD_X, 40), 
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
+        
+        # Gesture Debug
+        cv2.putText(frame, active_gesture, (w - 250 + MODE_X_OFFSET, 40), 
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 1)
 
-    cv2.imshow("PPT Controller", frame)
+        cv2.imshow("PPT Controller", frame)
+        next_show = max(next_show + UI_INTERVAL, now) # Don't burst after a stall
     
-    if cv2.waitKey(1) & 0xFF == ord('q'):
-        break
+    # Non-blocking key check (waitKey(1) sleeps every iteration)
+    if cv2.pollKey() & 0xFF == ord('q'):
+        stop_event.set()
 
+capture_thread.join()
+inference_thread.join()
 cap.release()
 cv2.destroyAllWindows()
-hands.close()
\ No newline at end of file
+landmarker.close()
+ppt.close()
\ No newline at end of file